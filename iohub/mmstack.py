@@ -3,7 +3,7 @@ from __future__ import annotations
 import io
 import json
 import logging
-from copy import copy
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING, Iterable
 from warnings import catch_warnings, filterwarnings
@@ -27,6 +27,8 @@ if TYPE_CHECKING:
 __all__ = ["MMOmeTiffFOV", "MMStack"]
 _logger = logging.getLogger(__name__)
 
+_OME_TIFF_SUFFIXES = (".ome.tif", ".ome.tiff")
+
 
 def _normalize_mm_pos_key(key: str | int) -> int:
     try:
@@ -63,20 +65,33 @@ def _tiff_to_fsspec_store(
     return zarr.storage.FsspecStore(fs=fs)
 
 
+def _list_ome_tiffs(folder: Path) -> list[Path]:
+    """List OME-TIFF files in a directory in natural order.
+
+    Uses a single ``os.scandir`` pass so that the file type
+    comes from the directory entry instead of a ``stat`` per file.
+    """
+    with os.scandir(folder) as entries:
+        return natsorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(_OME_TIFF_SUFFIXES) and entry.is_file()
+        )
+
+
 def find_first_ome_tiff_in_mmstack(data_path: Path) -> Path:
     if data_path.is_file():
-        if "ome.tif" in data_path.name:
+        if data_path.name.endswith(_OME_TIFF_SUFFIXES):
             return data_path
         else:
-            raise ValueError("{data_path} is not a OME-TIFF file.")
+            raise ValueError(f"{data_path} is not a OME-TIFF file.")
     elif data_path.is_dir():
-        files = data_path.glob("*.ome.tif")
-        try:
-            return next(files)
-        except StopIteration:
+        files = _list_ome_tiffs(data_path)
+        if not files:
             raise FileNotFoundError(
                 f"Path {data_path} contains no OME-TIFF files."
             )
+        return files[0]
     raise FileNotFoundError(f"Path {data_path} does not exist.")
 
 
@@ -117,11 +132,22 @@ class MMStack(MicroManagerFOVMapping):
     data_path : StrOrBytesPath
         Path to the directory containing OME-TIFF files
         or the path to the first OME-TIFF file in the series
+    chunks : dict[str, int] | None, optional
+        Dask chunk sizes keyed by axis name (R, T, C, Z, Y, X),
+        by default None (one chunk per TIFF page, i.e. ``(1, 1, 1, Y, X)``,
+        which suits random access of single planes).
+        Use e.g. ``{"Z": -1}`` to read whole Z-stacks per chunk
+        for volumetric access patterns.
     """
 
-    def __init__(self, data_path: StrOrBytesPath):
+    def __init__(
+        self,
+        data_path: StrOrBytesPath,
+        chunks: dict[str, int] | None = None,
+    ):
         super().__init__()
         data_path = Path(data_path)
+        self._chunks = chunks
         first_file = find_first_ome_tiff_in_mmstack(data_path)
         self._root = first_file.parent
         self.dirname = self._root.name
@@ -136,13 +162,15 @@ class MMStack(MicroManagerFOVMapping):
 
     def _parse_data(self):
         series = self._first_tif.series[0]
-        raw_dims = dict(
-            (axis, size)
-            for axis, size in zip(series.get_axes(), series.get_shape())
-        )
+        raw_axes = tuple(series.get_axes())
         axes = ("R", "T", "C", "Z", "Y", "X")
-        dims = dict((ax, raw_dims.get(ax, 1)) for ax in axes)
-        _logger.debug(f"Got dataset dimensions from tifffile: {dims}.")
+        dims = [1] * len(axes)
+        for axis, size in zip(raw_axes, series.get_shape()):
+            if axis in axes:
+                dims[axes.index(axis)] = size
+        _logger.debug(
+            f"Got dataset dimensions {axes} from tifffile: {tuple(dims)}."
+        )
         (
             self.positions,
             self.frames,
@@ -150,7 +178,7 @@ class MMStack(MicroManagerFOVMapping):
             self.slices,
             self.height,
             self.width,
-        ) = dims.values()
+        ) = dims
         self._set_mm_meta(self._first_tif.micromanager_metadata)
         zarr_tiff_store = series.aszarr(multiscales=True)
         self._store = _tiff_to_fsspec_store(
@@ -159,10 +187,12 @@ class MMStack(MicroManagerFOVMapping):
         _logger.debug(f"Opened {self._store}.")
         data = da.from_zarr(zarr.open(self._store, mode="r")["0"])
         self.dtype = data.dtype
-        img = DataArray(data, dims=raw_dims, name=self.dirname)
+        img = DataArray(data, dims=raw_axes, name=self.dirname)
         xarr = img.expand_dims(
             [ax for ax in axes if ax not in img.dims]
         ).transpose(*axes)
+        if self._chunks:
+            xarr = xarr.chunk(self._chunks)
         if self.channels > len(self.channel_names):
             for c in range(self.channels):
                 if c >= len(self.channel_names):
@@ -201,8 +231,9 @@ class MMStack(MicroManagerFOVMapping):
         return key in self.xdata
 
     def __iter__(self) -> Iterable[tuple[str, MMOmeTiffFOV]]:
-        for key in self.xdata:
-            yield str(key), self[key]
+        # positions are named by their integer index along the R axis
+        for key in range(len(self)):
+            yield str(key), MMOmeTiffFOV(self, key)
 
     def __enter__(self) -> MMStack:
         return self
@@ -217,70 +248,58 @@ class MMStack(MicroManagerFOVMapping):
     def _set_mm_meta(self, mm_meta: dict) -> None:
         """Assign image metadata from summary metadata."""
         self._mm_meta = mm_meta
-        self.channel_names = []
-        mm_version = self._mm_meta["Summary"]["MicroManagerVersion"]
+        summary = self._mm_meta["Summary"]
+        mm_version = summary["MicroManagerVersion"]
         if "beta" in mm_version:
-            if self._mm_meta["Summary"]["Positions"] > 1:
-                self._stage_positions = []
-
-                for p in range(
-                    len(self._mm_meta["Summary"]["StagePositions"])
-                ):
-                    pos = self._simplify_stage_position_beta(
-                        self._mm_meta["Summary"]["StagePositions"][p]
-                    )
-                    self._stage_positions.append(pos)
+            if summary["Positions"] > 1:
+                self._stage_positions = [
+                    self._simplify_stage_position_beta(stage_pos)
+                    for stage_pos in summary["StagePositions"]
+                ]
 
             # MM beta versions sometimes don't have 'ChNames',
             # so I'm wrapping in a try-except and setting the
             # channel names to empty strings if it fails.
             try:
-                for ch in self._mm_meta["Summary"]["ChNames"]:
-                    self.channel_names.append(ch)
+                self.channel_names = list(summary["ChNames"])
             except Exception:
-                self.channel_names = self._mm_meta["Summary"]["Channels"] * [
-                    ""
-                ]  # empty strings
+                self.channel_names = summary["Channels"] * [""]
 
         elif mm_version == "1.4.22":
-            for ch in self._mm_meta["Summary"].get("ChNames", []):
-                self.channel_names.append(ch)
+            self.channel_names = list(summary.get("ChNames", []))
 
         # Parsing of data acquired with the OpenCell
         # acquisition script on the Dragonfly miroscope
         elif (
             mm_version == "2.0.1 20220920"
-            and self._mm_meta["Summary"].get("Prefix", None) == "raw_data"
+            and summary.get("Prefix", None) == "raw_data"
         ):
-            files = natsorted(self.root.glob("*.ome.tif"))
+            files = _list_ome_tiffs(self.root)
             self.positions = len(files)  # not all positions are saved
 
-            if self._mm_meta["Summary"]["Positions"] > 1:
-                self._stage_positions = [None] * self.positions
-
-                for p_idx, file_name in enumerate(files):
-                    site_idx = int(str(file_name).split("_")[-1].split("-")[0])
-                    pos = self._simplify_stage_position(
-                        self._mm_meta["Summary"]["StagePositions"][site_idx]
+            if summary["Positions"] > 1:
+                self._stage_positions = [
+                    self._simplify_stage_position(
+                        summary["StagePositions"][
+                            int(str(file_name).split("_")[-1].split("-")[0])
+                        ]
                     )
-                    self._stage_positions[p_idx] = pos
+                    for file_name in files
+                ]
 
-            for ch in self._mm_meta["Summary"]["ChNames"]:
-                self.channel_names.append(ch)
+            self.channel_names = list(summary["ChNames"])
 
         else:
-            if self._mm_meta["Summary"].get("Positions", 1) > 1:
-                self._stage_positions = []
-
-                for p in range(self._mm_meta["Summary"]["Positions"]):
-                    pos = self._simplify_stage_position(
-                        self._mm_meta["Summary"]["StagePositions"][p]
-                    )
-                    self._stage_positions.append(pos)
-
-            for ch in self._mm_meta["Summary"].get("ChNames", []):
-                self.channel_names.append(ch)
-        z_step_size = float(self._mm_meta["Summary"].get("z-step_um", 1.0))
+            if summary.get("Positions", 1) > 1:
+                self._stage_positions = [
+                    self._simplify_stage_position(stage_pos)
+                    for stage_pos in summary["StagePositions"][
+                        : summary["Positions"]
+                    ]
+                ]
+
+            self.channel_names = list(summary.get("ChNames", []))
+        z_step_size = float(summary.get("z-step_um", 1.0))
         if z_step_size == 0:
             if self.slices == 1:
                 z_step_size = 1.0
@@ -290,11 +309,9 @@ class MMStack(MicroManagerFOVMapping):
                     "Using 1.0 um instead."
                 )
         self._z_step_size = z_step_size
-        self.height = self._mm_meta["Summary"]["Height"]
-        self.width = self._mm_meta["Summary"]["Width"]
-        self._t_scale = (
-            float(self._mm_meta["Summary"].get("Interval_ms", 1e3)) / 1e3
-        )
+        self.height = summary["Height"]
+        self.width = summary["Width"]
+        self._t_scale = float(summary.get("Interval_ms", 1e3)) / 1e3
 
     def _simplify_stage_position(self, stage_pos: dict):
         """
@@ -312,10 +329,9 @@ class MMStack(MicroManagerFOVMapping):
             flattened dictionary
         """
 
-        out = copy(stage_pos)
-        out.pop("DevicePositions")
+        out = {k: v for k, v in stage_pos.items() if k != "DevicePositions"}
         for dev_pos in stage_pos["DevicePositions"]:
-            out.update({dev_pos["Device"]: dev_pos["Position_um"]})
+            out[dev_pos["Device"]] = dev_pos["Position_um"]
         return out
 
     def _simplify_stage_position_beta(self, stage_pos: dict) -> dict:
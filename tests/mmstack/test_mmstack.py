@@ -23,6 +23,12 @@ def test_mmstack_ctx(ome_tiff):
         assert "MMStack" in mmstack.__repr__()
 
 
+def test_mmstack_chunks(ome_tiff):
+    with MMStack(ome_tiff, chunks={"Z": -1}) as mmstack:
+        for _, fov in mmstack:
+            assert fov.xdata.data.chunksize[2] == fov.shape[2]
+
+
 def test_mmstack_nonexisting(tmpdir):
     with pytest.raises(FileNotFoundError):
         MMStack(tmpdir / "nonexisting")